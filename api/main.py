@@ -3,29 +3,132 @@ FastAPI Inference Service for NLP Manipulation Detector
 
 Production-ready inference API for detecting manipulative language in text.
 Loads a fine-tuned DistilBERT model at startup and provides a /predict endpoint.
+By default inference runs through ONNX Runtime on a graph exported once from the
+PyTorch checkpoint; set INFERENCE_BACKEND=torch to use a frozen TorchScript
+module or INFERENCE_BACKEND=openvino to use an OpenVINO engine instead.
 
 Usage:
     uvicorn main:app --host 0.0.0.0 --port 8000 --reload
 """
 
+import asyncio
+import hashlib
 import logging
+import math
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
-
-import torch
-from fastapi import FastAPI, HTTPException, status
-from pydantic import BaseModel, Field, field_validator
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Per-process CPU thread budget. With WORKERS uvicorn processes each one gets
+# an equal share of the cores; OpenMP/MKL read these variables when torch is
+# imported, so they must be set before the imports below.
+WORKERS = int(os.getenv("WORKERS", "1"))
+os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // WORKERS)))
+os.environ.setdefault("MKL_NUM_THREADS", os.environ["OMP_NUM_THREADS"])
+
+import numpy as np  # noqa: E402
+import onnxruntime as ort  # noqa: E402
+import psutil  # noqa: E402
+import torch  # noqa: E402
+from filelock import FileLock  # noqa: E402
+from fastapi import FastAPI, HTTPException, status  # noqa: E402
+from fastapi.responses import ORJSONResponse  # noqa: E402
+from pydantic import BaseModel, Field, field_validator  # noqa: E402
+from transformers import (  # noqa: E402
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    PreTrainedTokenizerFast
+)
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-# Model configuration
-MODEL_PATH = Path("../models/manipulation_detector_model")
+# Model configuration (MODEL_PATH selects the checkpoint, e.g. the distilled
+# 3-layer student in ../models/manipulation_detector_tiny)
+MODEL_PATH = Path(os.getenv("MODEL_PATH", "../models/manipulation_detector_model"))
 MAX_INPUT_LENGTH = 512  # DistilBERT max sequence length
 MIN_INPUT_LENGTH = 3    # Minimum meaningful input
 
+# Inference backend: "onnx" (ONNX Runtime, default), "torch" (TorchScript)
+# or "openvino" (OpenVINO, converted from the ONNX graph)
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "onnx").lower()
+
+# Exported ONNX/OpenVINO graphs are written to a writable cache directory, not
+# next to the checkpoint (the model directory may be read-only, e.g. in the
+# container, which runs as a non-root user). Each checkpoint gets its own
+# subdirectory keyed by the name, size and mtime of its files, so a retrained
+# checkpoint at the same path is re-exported instead of served stale.
+MODEL_FINGERPRINT = hashlib.sha1(
+    "".join(
+        f"{f.name}:{f.stat().st_size}:{f.stat().st_mtime_ns};"
+        for f in sorted(MODEL_PATH.glob("*"))
+        if f.is_file()
+    ).encode("utf-8")
+).hexdigest()[:12]
+ONNX_CACHE_DIR = Path(os.getenv(
+    "ONNX_CACHE_DIR",
+    str(Path(tempfile.gettempdir()) / "manipulation_detector")
+)) / f"{MODEL_PATH.name}-{MODEL_FINGERPRINT}"
+ONNX_MODEL_PATH = ONNX_CACHE_DIR / "manipulation_detector.onnx"
+ONNX_OPSET_VERSION = 14
+OPENVINO_MODEL_PATH = ONNX_CACHE_DIR / "manipulation_detector.xml"
+
+# INT8 dynamic quantization of the Linear/MatMul weights (set to 0 to disable;
+# the OpenVINO backend uses FP16-compressed weights instead)
+QUANTIZE_INT8 = (
+    os.getenv("QUANTIZE_INT8", "1").lower() not in ("0", "false", "no")
+    and INFERENCE_BACKEND != "openvino"
+)
+ONNX_INT8_MODEL_PATH = ONNX_CACHE_DIR / "manipulation_detector.int8.onnx"
+
+# Probe texts used to log the FP32 -> INT8 prediction drift at startup
+QUANTIZATION_PROBE_TEXTS = [
+    "SHOCKING: Economy in COMPLETE MELTDOWN!",
+    "Government announces new infrastructure plan",
+    "URGENT: You WON'T BELIEVE what happened next!",
+    "Study shows moderate increase in unemployment rates",
+    "SHOCKING CRISIS: Everything is FALLING APART!",
+    "Central bank holds interest rates steady"
+]
+
+# Dynamic batching: concurrent requests arriving within the wait window are
+# coalesced into a single forward pass
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "16"))
+if MAX_BATCH_SIZE < 1:
+    raise ValueError(f"MAX_BATCH_SIZE must be at least 1, got {MAX_BATCH_SIZE}")
+MAX_BATCH_WAIT_MS = float(os.getenv("MAX_BATCH_WAIT_MS", "5"))
+
+# Inference thread pool: batches run off the event loop, up to
+# INFERENCE_THREADS at a time. CPU_THREADS is this process's thread budget.
+# ONNX Runtime sessions and OpenVINO compiled models own a single intra-op
+# pool shared by concurrent calls, so they get the whole budget; torch gives
+# every calling thread its own OpenMP team, so it gets an equal share each.
+INFERENCE_THREADS = int(os.getenv("INFERENCE_THREADS", "2"))
+if INFERENCE_THREADS < 1:
+    raise ValueError(f"INFERENCE_THREADS must be at least 1, got {INFERENCE_THREADS}")
+CPU_THREADS = int(os.environ["OMP_NUM_THREADS"])
+INTRA_OP_THREADS = max(1, CPU_THREADS // INFERENCE_THREADS)
+
+# Sequence lengths run through the model at startup so kernel selection, JIT
+# optimization and allocator warmup happen before the first real request
+WARMUP_LENGTHS = (16, 64, 256)
+WARMUP_RUNS = 2
+
+# Input buffers are reused across requests, bucketed by padded sequence length
+SEQUENCE_BUCKETS = tuple(
+    length for length in (8, 16, 32, 64, 128, 256, 512)
+    if length <= MAX_INPUT_LENGTH
+)
+
+# LRU cache of recent predictions keyed by text hash (0 disables caching)
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "4096"))
+
 # Label mapping
 LABEL_MAP = {
     0: "neutral",
@@ -45,14 +148,90 @@ logger = logging.getLogger(__name__)
 
 class ModelState:
     """Global container for loaded model and tokenizer."""
+    ready = False   # Set once the active backend is loaded and warmed up
     tokenizer = None
-    model = None
+    model = None    # PyTorch model (torch backend only after startup)
+    session = None  # ONNX Runtime session (onnx backend only)
+    compiled_model = None  # OpenVINO compiled model (openvino backend only)
     device = None
+    queue = None         # Pending (text, future) pairs for the batch worker
+    batch_worker = None  # Background task draining the queue
+    executor = None      # Thread pool running tokenization + inference
+    batch_slots = None   # Semaphore bounding in-flight batches to the pool size
+    tokenizer_lock = threading.Lock()  # Fast tokenizers are not thread-safe
 
 
 model_state = ModelState()
 
 
+class TensorPool:
+    """
+    Pool of preallocated (input_ids, attention_mask) buffers.
+
+    Buffers are shaped (MAX_BATCH_SIZE, bucket) for each length bucket and
+    handed out to one inference thread at a time, so requests reuse the same
+    memory instead of allocating fresh tensors per call. With pin_memory set
+    they are allocated in page-locked memory for non-blocking device copies.
+    """
+
+    def __init__(self, buckets: Tuple[int, ...], max_batch_size: int):
+        self.buckets = buckets
+        self.max_batch_size = max_batch_size
+        self.pin_memory = False
+        self._free: Dict[int, List[Tuple[torch.Tensor, torch.Tensor]]] = {
+            bucket: [] for bucket in buckets
+        }
+        self._lock = threading.Lock()
+
+    def bucket_for(self, length: int) -> int:
+        """Return the smallest bucket that fits a sequence of this length."""
+        for bucket in self.buckets:
+            if bucket >= length:
+                return bucket
+        return self.buckets[-1]
+
+    def acquire(self, bucket: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Borrow a buffer pair for the bucket, allocating one if none is free."""
+        with self._lock:
+            if self._free[bucket]:
+                return self._free[bucket].pop()
+
+        shape = (self.max_batch_size, bucket)
+        return (
+            torch.zeros(shape, dtype=torch.long, pin_memory=self.pin_memory),
+            torch.zeros(shape, dtype=torch.long, pin_memory=self.pin_memory)
+        )
+
+    def release(self, bucket: int, buffers: Tuple[torch.Tensor, torch.Tensor]) -> None:
+        """Return a borrowed buffer pair to the pool."""
+        with self._lock:
+            self._free[bucket].append(buffers)
+
+
+tensor_pool = TensorPool(SEQUENCE_BUCKETS, MAX_BATCH_SIZE)
+
+# Per-thread scratch dicts (model inputs, ONNX feeds) reused across batches
+thread_buffers = threading.local()
+
+
+def get_thread_dict(name: str) -> dict:
+    """
+    Return the calling thread's reusable dict for name, emptied.
+
+    Args:
+        name: Buffer name, one dict per name and thread
+
+    Returns:
+        Empty dict owned by the calling thread
+    """
+    buffer = getattr(thread_buffers, name, None)
+    if buffer is None:
+        buffer = {}
+        setattr(thread_buffers, name, buffer)
+    buffer.clear()
+    return buffer
+
+
 # ============================================================================
 # PYDANTIC MODELS
 # ============================================================================
@@ -129,6 +308,482 @@ class HealthResponse(BaseModel):
     status: str
     model_loaded: bool
     device: str
+    backend: str
+    cache_hits: int
+    cache_size: int
+
+
+# ============================================================================
+# PREDICTION CACHE
+# ============================================================================
+
+class PredictionCache:
+    """
+    LRU cache of predictions keyed by the SHA-1 of the input text.
+
+    Repeated texts (e.g. the UI example buttons) skip tokenization and
+    inference entirely. Only accessed from the event loop, so no locking.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, PredictionResponse]" = OrderedDict()
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get(self, text: str) -> Optional[PredictionResponse]:
+        """Return the cached prediction for text, or None on a miss."""
+        key = self._key(text)
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, text: str, result: PredictionResponse) -> None:
+        """Store a prediction, evicting the least recently used entry."""
+        if self.maxsize <= 0:
+            return
+
+        key = self._key(text)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+prediction_cache = PredictionCache(PREDICTION_CACHE_SIZE)
+
+
+# ============================================================================
+# INFERENCE BACKENDS
+# ============================================================================
+
+def build_artifact(
+    path: Path,
+    build: Callable[[Path], None],
+    companion_suffixes: Tuple[str, ...] = ()
+) -> None:
+    """
+    Build a cached model artifact once, atomically, across worker processes.
+
+    The artifact is built into a temporary file and moved into place with
+    os.replace, so readers never see a half-written file and a crashed build
+    leaves nothing behind. A file lock serializes concurrent workers; whoever
+    gets the lock second finds the artifact already built.
+
+    Args:
+        path: Final artifact path
+        build: Callable writing the artifact to the temporary path it is given
+        companion_suffixes: Suffixes of extra files written next to the
+            artifact (e.g. ".bin" for OpenVINO IR), moved before the main file
+    """
+    if path.exists():
+        return
+
+    with FileLock(str(path) + ".lock"):
+        if path.exists():
+            return
+
+        tmp_path = path.with_name(f"{path.stem}.tmp{os.getpid()}{path.suffix}")
+        tmp_files = [tmp_path] + [tmp_path.with_suffix(s) for s in companion_suffixes]
+        try:
+            build(tmp_path)
+            for suffix in companion_suffixes:
+                os.replace(tmp_path.with_suffix(suffix), path.with_suffix(suffix))
+            os.replace(tmp_path, path)
+        finally:
+            for tmp_file in tmp_files:
+                tmp_file.unlink(missing_ok=True)
+
+
+def export_onnx_model(model: torch.nn.Module, onnx_path: Path) -> None:
+    """
+    Export the PyTorch classifier to an ONNX graph.
+
+    Batch and sequence dimensions are exported as dynamic axes so a single
+    graph serves every input length.
+
+    Args:
+        model: Loaded classifier in eval mode
+        onnx_path: Destination file for the exported graph
+    """
+    dummy_ids = torch.ones((1, 16), dtype=torch.long)
+    dummy_mask = torch.ones_like(dummy_ids)
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy_ids, dummy_mask),
+            str(onnx_path),
+            opset_version=ONNX_OPSET_VERSION,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"}
+            }
+        )
+
+
+def create_onnx_session(onnx_path: Path) -> ort.InferenceSession:
+    """
+    Create an ONNX Runtime session with all graph optimizations enabled.
+
+    ORT_ENABLE_ALL fuses the MatMul+Add+LayerNorm+GELU sequences of the
+    encoder blocks and dispatches them to the MLAS CPU kernels.
+
+    Args:
+        onnx_path: Path to the exported ONNX graph
+
+    Returns:
+        Ready-to-use InferenceSession on the CPU execution provider
+    """
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_options.intra_op_num_threads = CPU_THREADS
+
+    return ort.InferenceSession(
+        str(onnx_path),
+        sess_options=sess_options,
+        providers=["CPUExecutionProvider"]
+    )
+
+
+def convert_openvino_model(onnx_path: Path, ir_path: Path) -> None:
+    """
+    Convert the ONNX graph to OpenVINO IR with FP16-compressed weights.
+
+    Args:
+        onnx_path: Path to the FP32 ONNX graph
+        ir_path: Destination .xml file (the .bin weights are written alongside)
+    """
+    import openvino as ov
+
+    ov.save_model(ov.convert_model(str(onnx_path)), str(ir_path), compress_to_fp16=True)
+
+
+def compile_openvino_model(ir_path: Path):
+    """
+    Compile the OpenVINO IR for the CPU plugin with the latency hint.
+
+    Args:
+        ir_path: Path to the OpenVINO .xml model
+
+    Returns:
+        OpenVINO CompiledModel
+    """
+    import openvino as ov
+
+    core = ov.Core()
+    return core.compile_model(
+        core.read_model(str(ir_path)),
+        "CPU",
+        {
+            "PERFORMANCE_HINT": "LATENCY",
+            "INFERENCE_NUM_THREADS": CPU_THREADS
+        }
+    )
+
+
+def quantize_onnx_model(onnx_path: Path, int8_path: Path) -> None:
+    """
+    Write an INT8 dynamically quantized copy of an ONNX graph.
+
+    Args:
+        onnx_path: Path to the FP32 ONNX graph
+        int8_path: Destination file for the quantized graph
+    """
+    # Needs the onnx package, so only import it when quantizing
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(
+        str(onnx_path),
+        str(int8_path),
+        weight_type=QuantType.QInt8
+    )
+
+
+def quantize_torch_model(model: torch.nn.Module) -> torch.nn.Module:
+    """
+    Apply INT8 dynamic quantization to every nn.Linear of the classifier.
+
+    Weights are stored as int8 and run through the fbgemm int8 GEMM kernels,
+    halving the weight bandwidth of the encoder blocks.
+
+    Args:
+        model: Loaded FP32 classifier in eval mode
+
+    Returns:
+        Quantized copy of the model
+    """
+    if "fbgemm" in torch.backends.quantized.supported_engines:
+        torch.backends.quantized.engine = "fbgemm"
+
+    return torch.quantization.quantize_dynamic(
+        model,
+        {torch.nn.Linear},
+        dtype=torch.qint8
+    )
+
+
+def log_quantization_delta(reference: torch.nn.Module) -> None:
+    """
+    Log how far the active INT8 backend drifts from the FP32 model.
+
+    Args:
+        reference: Unquantized classifier used as the baseline
+    """
+    inputs = model_state.tokenizer(
+        QUANTIZATION_PROBE_TEXTS,
+        return_tensors="pt",
+        truncation=True,
+        padding="longest",
+        max_length=MAX_INPUT_LENGTH
+    )
+
+    with torch.inference_mode():
+        fp32_logits = reference(**inputs).logits.numpy()
+    int8_logits = run_model(inputs)
+
+    agreement = float((fp32_logits.argmax(axis=-1) == int8_logits.argmax(axis=-1)).mean())
+    max_delta = float(np.abs(fp32_logits - int8_logits).max())
+    logger.info(
+        f"INT8 quantization check on {len(QUANTIZATION_PROBE_TEXTS)} probe texts: "
+        f"label agreement {agreement:.1%}, max logit delta {max_delta:.4f}"
+    )
+
+
+def trace_torch_model(model: torch.nn.Module) -> torch.jit.ScriptModule:
+    """
+    Trace the classifier with TorchScript and freeze it.
+
+    Freezing inlines the parameters as constants and applies the oneDNN
+    fusions (Linear+GELU, LayerNorm), removing the per-layer Python dispatch
+    of the nn.Module hierarchy.
+
+    Args:
+        model: Loaded classifier in eval mode
+
+    Returns:
+        Frozen TorchScript module taking (input_ids, attention_mask)
+    """
+    dummy_ids = torch.ones((1, MAX_INPUT_LENGTH), dtype=torch.long)
+    dummy_mask = torch.ones_like(dummy_ids)
+
+    with torch.no_grad():
+        traced = torch.jit.trace(model, (dummy_ids, dummy_mask), strict=False)
+        frozen = torch.jit.freeze(traced)
+
+    return frozen
+
+
+def run_model(inputs) -> np.ndarray:
+    """
+    Run a forward pass on the active backend.
+
+    Args:
+        inputs: Tokenizer output with 'input_ids' and 'attention_mask' tensors
+
+    Returns:
+        Logits as a (batch, num_labels) NumPy array
+    """
+    if model_state.session is not None:
+        feed = get_thread_dict("feed")
+        feed["input_ids"] = inputs["input_ids"].numpy()
+        feed["attention_mask"] = inputs["attention_mask"].numpy()
+        return model_state.session.run(None, feed)[0]
+
+    if model_state.compiled_model is not None:
+        # Infer requests are not thread-safe, so each thread keeps its own
+        infer_request = getattr(thread_buffers, "infer_request", None)
+        if infer_request is None:
+            infer_request = model_state.compiled_model.create_infer_request()
+            thread_buffers.infer_request = infer_request
+
+        feed = get_thread_dict("feed")
+        feed["input_ids"] = inputs["input_ids"].numpy()
+        feed["attention_mask"] = inputs["attention_mask"].numpy()
+        infer_request.infer(feed)
+
+        # The output buffer is reused by the next inference on this request
+        return infer_request.get_output_tensor(0).data.copy()
+
+    # TorchScript modules reject keyword arguments, so pass inputs positionally;
+    # inference_mode also skips the version counter and view tracking
+    with torch.inference_mode():
+        outputs = model_state.model(inputs["input_ids"], inputs["attention_mask"])
+        return outputs["logits"].cpu().numpy()
+
+
+def warmup_model() -> None:
+    """
+    Run dummy forward passes at representative sequence lengths.
+
+    The first calls on a fresh model pay for oneDNN/MLAS kernel selection,
+    TorchScript profiling and optimization, and allocator growth; running
+    them here keeps that cost off the first /predict requests.
+    """
+    with torch.jit.optimized_execution(True):
+        for length in WARMUP_LENGTHS:
+            input_ids = torch.zeros((1, length), dtype=torch.long)
+            attention_mask = torch.ones_like(input_ids)
+            for _ in range(WARMUP_RUNS):
+                run_model({"input_ids": input_ids, "attention_mask": attention_mask})
+
+
+# ============================================================================
+# DYNAMIC BATCHING
+# ============================================================================
+
+def classify_batch(texts: List[str]) -> List[PredictionResponse]:
+    """
+    Classify a batch of texts with a single forward pass.
+
+    Args:
+        texts: Input texts to classify
+
+    Returns:
+        One PredictionResponse per input text, in the same order
+    """
+    # Tokenize to plain token id lists; padding happens in the pooled buffers
+    with model_state.tokenizer_lock:
+        sequences = model_state.tokenizer(
+            texts,
+            truncation=True,
+            padding=False,
+            max_length=MAX_INPUT_LENGTH,
+            return_attention_mask=False
+        )["input_ids"]
+
+    # Copy the ids into reusable buffers padded to the length bucket
+    bucket = tensor_pool.bucket_for(max(len(ids) for ids in sequences))
+    buffers = tensor_pool.acquire(bucket)
+
+    try:
+        input_ids = buffers[0][:len(sequences)]
+        attention_mask = buffers[1][:len(sequences)]
+        input_ids.zero_()
+        attention_mask.zero_()
+
+        ids_view = input_ids.numpy()
+        mask_view = attention_mask.numpy()
+        for row, ids in enumerate(sequences):
+            ids_view[row, :len(ids)] = ids
+            mask_view[row, :len(ids)] = 1
+
+        inputs = get_thread_dict("inputs")
+        inputs["input_ids"] = input_ids
+        inputs["attention_mask"] = attention_mask
+
+        # Move inputs to device (the buffers already live on the CPU; on an
+        # accelerator they are pinned, so the copy can be asynchronous)
+        if model_state.device.type != "cpu":
+            inputs = {
+                k: v.to(model_state.device, non_blocking=True)
+                for k, v in inputs.items()
+            }
+
+        # Run inference on the active backend
+        logits = run_model(inputs)
+    finally:
+        tensor_pool.release(bucket, buffers)
+
+    # Get predictions and confidences: argmax on the logits, then a stable
+    # softmax over the few class scores in plain Python
+    results = []
+    for row in logits.tolist():
+        predicted_class = max(range(len(row)), key=row.__getitem__)
+        top = row[predicted_class]
+        confidence = 1.0 / sum(math.exp(x - top) for x in row)
+        results.append(
+            PredictionResponse(
+                label=LABEL_MAP.get(predicted_class, "unknown"),
+                confidence=round(confidence, 4)
+            )
+        )
+
+    return results
+
+
+async def run_batch(batch: List[tuple]) -> None:
+    """
+    Classify one batch on the thread pool and resolve its futures.
+
+    Args:
+        batch: (text, future) pairs taken from the queue
+    """
+    loop = asyncio.get_running_loop()
+
+    try:
+        results = await loop.run_in_executor(
+            model_state.executor,
+            classify_batch,
+            [text for text, _ in batch]
+        )
+    except Exception as e:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        return
+    finally:
+        model_state.batch_slots.release()
+
+    for (_, future), result in zip(batch, results):
+        if not future.done():
+            future.set_result(result)
+
+
+async def batch_worker() -> None:
+    """
+    Drain the request queue and dispatch coalesced batches.
+
+    Waits for a free inference thread and the first request, then keeps
+    collecting until either MAX_BATCH_SIZE requests are queued or
+    MAX_BATCH_WAIT_MS has elapsed. While every thread is busy, requests
+    accumulate in the queue and form larger batches. Results (or the
+    inference error) are delivered through each request's future.
+    """
+    loop = asyncio.get_running_loop()
+    queue = model_state.queue
+    in_flight = set()
+
+    while True:
+        await model_state.batch_slots.acquire()
+
+        batch = [await queue.get()]
+        deadline = loop.time() + MAX_BATCH_WAIT_MS / 1000
+
+        while len(batch) < MAX_BATCH_SIZE:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        logger.debug(f"Dispatching batch of {len(batch)} request(s)")
+
+        # Keep a reference so the task is not garbage collected mid-flight
+        task = asyncio.create_task(run_batch(batch))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
 
 
 # ============================================================================
@@ -149,25 +804,140 @@ async def lifespan(app: FastAPI):
         # Set device (CPU only as per requirements)
         model_state.device = torch.device("cpu")
         logger.info(f"Using device: {model_state.device}")
+        tensor_pool.pin_memory = model_state.device.type == "cuda"
+
+        # Pin torch's intra-op pool to the per-thread share and keep inter-op
+        # parallelism off; concurrency comes from the inference thread pool.
+        # The inter-op pool can only be sized once per process (running
+        # main.py imports this module twice), so skip it if already set.
+        torch.set_num_threads(INTRA_OP_THREADS)
+        if torch.get_num_interop_threads() != 1:
+            try:
+                torch.set_num_interop_threads(1)
+            except RuntimeError as e:
+                logger.warning(f"Could not set torch inter-op threads: {e}")
 
         # Load tokenizer
         logger.info(f"Loading tokenizer from {MODEL_PATH}")
         model_state.tokenizer = AutoTokenizer.from_pretrained(
-            "distilbert-base-uncased"
+            "distilbert-base-uncased",
+            use_fast=True
         )
+        if not isinstance(model_state.tokenizer, PreTrainedTokenizerFast):
+            raise TypeError(
+                f"Expected a fast (Rust) tokenizer, got {type(model_state.tokenizer).__name__}"
+            )
+        logger.info(f"Using fast tokenizer: {type(model_state.tokenizer).__name__}")
+
+        # The PyTorch checkpoint is only needed by the torch backend, or to
+        # export the ONNX graph the other backends are built from
+        if INFERENCE_BACKEND in ("onnx", "openvino"):
+            ONNX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        needs_export = (
+            INFERENCE_BACKEND == "onnx"
+            or (INFERENCE_BACKEND == "openvino" and not OPENVINO_MODEL_PATH.exists())
+        ) and not ONNX_MODEL_PATH.exists()
+
+        # Unquantized model used to measure the quantization drift
+        reference_model = None
+
+        if INFERENCE_BACKEND == "torch" or needs_export:
+            # Load model (memory-mapped weights, no temporary second copy)
+            logger.info(f"Loading model from {MODEL_PATH}")
+            process = psutil.Process()
+            rss_before = process.memory_info().rss
+            model_state.model = AutoModelForSequenceClassification.from_pretrained(
+                str(MODEL_PATH),
+                dtype=torch.float32,
+                low_cpu_mem_usage=True
+            )
+            rss_after = process.memory_info().rss
+            logger.info(
+                f"Process RSS: {rss_before / 2**20:.0f}MB before model load, "
+                f"{rss_after / 2**20:.0f}MB after"
+            )
 
-        # Load model
-        logger.info(f"Loading model from {MODEL_PATH}")
-        model_state.model = AutoModelForSequenceClassification.from_pretrained(
-            str(MODEL_PATH)
-        )
+            # Move model to device and set to eval mode
+            model_state.model.to(model_state.device)
+            model_state.model.eval()
+
+            logger.info(f"Model parameters: {sum(p.numel() for p in model_state.model.parameters()):,}")
+            reference_model = model_state.model
+
+        # Export the ONNX graph once if missing (also the OpenVINO source)
+        if needs_export:
+            logger.info(f"Exporting ONNX graph to {ONNX_MODEL_PATH}")
+            build_artifact(
+                ONNX_MODEL_PATH,
+                lambda tmp_path: export_onnx_model(model_state.model, tmp_path)
+            )
 
-        # Move model to device and set to eval mode
-        model_state.model.to(model_state.device)
-        model_state.model.eval()
+        # Build the ONNX Runtime session
+        if INFERENCE_BACKEND == "onnx":
+            onnx_path = ONNX_MODEL_PATH
+            if QUANTIZE_INT8:
+                if not ONNX_INT8_MODEL_PATH.exists():
+                    logger.info(f"Quantizing ONNX graph to {ONNX_INT8_MODEL_PATH}")
+                    build_artifact(
+                        ONNX_INT8_MODEL_PATH,
+                        lambda tmp_path: quantize_onnx_model(ONNX_MODEL_PATH, tmp_path)
+                    )
+                onnx_path = ONNX_INT8_MODEL_PATH
+
+            logger.info(f"Loading ONNX Runtime session from {onnx_path}")
+            model_state.session = create_onnx_session(onnx_path)
+        elif INFERENCE_BACKEND == "openvino":
+            if not OPENVINO_MODEL_PATH.exists():
+                logger.info(f"Converting ONNX graph to OpenVINO IR at {OPENVINO_MODEL_PATH}")
+                build_artifact(
+                    OPENVINO_MODEL_PATH,
+                    lambda tmp_path: convert_openvino_model(ONNX_MODEL_PATH, tmp_path),
+                    companion_suffixes=(".bin",)
+                )
+
+            logger.info(f"Compiling OpenVINO model from {OPENVINO_MODEL_PATH}")
+            model_state.compiled_model = compile_openvino_model(OPENVINO_MODEL_PATH)
+        elif INFERENCE_BACKEND == "torch":
+            if QUANTIZE_INT8:
+                logger.info("Applying INT8 dynamic quantization to Linear layers")
+                model_state.model = quantize_torch_model(model_state.model)
+
+            logger.info("Tracing and freezing TorchScript module")
+            model_state.model = trace_torch_model(model_state.model)
+        else:
+            raise ValueError(f"Unknown INFERENCE_BACKEND: {INFERENCE_BACKEND}")
+
+        logger.info(f"Inference backend: {INFERENCE_BACKEND} (int8: {QUANTIZE_INT8})")
+
+        # Warm up the backend before accepting requests
+        logger.info(f"Warming up model (sequence lengths: {WARMUP_LENGTHS})")
+        warmup_model()
+
+        if QUANTIZE_INT8 and reference_model is not None:
+            log_quantization_delta(reference_model)
+        del reference_model
+
+        # Only the torch backend runs the PyTorch model; free it otherwise
+        if INFERENCE_BACKEND != "torch":
+            model_state.model = None
+
+        # Start the inference thread pool and the micro-batching worker
+        model_state.executor = ThreadPoolExecutor(
+            max_workers=INFERENCE_THREADS,
+            thread_name_prefix="inference"
+        )
+        model_state.batch_slots = asyncio.Semaphore(INFERENCE_THREADS)
+        model_state.queue = asyncio.Queue()
+        model_state.batch_worker = asyncio.create_task(batch_worker())
+        logger.info(
+            f"Batch worker started (max batch: {MAX_BATCH_SIZE}, "
+            f"max wait: {MAX_BATCH_WAIT_MS}ms, workers: {WORKERS}, "
+            f"inference threads: {INFERENCE_THREADS}, "
+            f"cpu threads: {CPU_THREADS}, torch threads per call: {INTRA_OP_THREADS})"
+        )
 
+        model_state.ready = True
         logger.info("Model and tokenizer loaded successfully")
-        logger.info(f"Model parameters: {sum(p.numel() for p in model_state.model.parameters()):,}")
 
     except Exception as e:
         logger.error(f"Failed to load model: {e}")
@@ -178,6 +948,19 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Cleanup
     logger.info("Shutting down: Cleaning up resources...")
+    model_state.batch_worker.cancel()
+    try:
+        await model_state.batch_worker
+    except asyncio.CancelledError:
+        pass
+    model_state.batch_worker = None
+    model_state.queue = None
+    model_state.executor.shutdown(wait=True)
+    model_state.executor = None
+    model_state.batch_slots = None
+    model_state.ready = False
+    model_state.session = None
+    model_state.compiled_model = None
     model_state.model = None
     model_state.tokenizer = None
     logger.info("Shutdown complete")
@@ -191,7 +974,8 @@ app = FastAPI(
     title="NLP Manipulation Detector API",
     description="Inference API for detecting manipulative language in text using fine-tuned DistilBERT",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson instead of stdlib json
 )
 
 
@@ -221,13 +1005,21 @@ async def health_check():
     Returns the current status of the API and whether the model is loaded.
     """
     return {
-        "status": "healthy" if model_state.model is not None else "unhealthy",
-        "model_loaded": model_state.model is not None,
-        "device": str(model_state.device) if model_state.device else "unknown"
+        "status": "healthy" if model_state.ready else "unhealthy",
+        "model_loaded": model_state.ready,
+        "device": str(model_state.device) if model_state.device else "unknown",
+        "backend": INFERENCE_BACKEND,
+        "cache_hits": prediction_cache.hits,
+        "cache_size": len(prediction_cache)
     }
 
 
-@app.post("/predict", response_model=PredictionResponse, tags=["Prediction"])
+@app.post(
+    "/predict",
+    response_model=PredictionResponse,
+    response_class=ORJSONResponse,
+    tags=["Prediction"]
+)
 async def predict(request: PredictionRequest):
     """
     Predict whether input text is manipulative or neutral.
@@ -242,7 +1034,7 @@ async def predict(request: PredictionRequest):
         HTTPException: If model is not loaded or inference fails
     """
     # Check if model is loaded
-    if model_state.model is None or model_state.tokenizer is None:
+    if not model_state.ready:
         logger.error("Prediction attempted but model not loaded")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -253,41 +1045,19 @@ async def predict(request: PredictionRequest):
         # Log request (without full text for privacy)
         logger.info(f"Prediction request received (text length: {len(request.text)} chars)")
 
-        # Tokenize input
-        inputs = model_state.tokenizer(
-            request.text,
-            return_tensors="pt",
-            truncation=True,
-            padding=True,
-            max_length=MAX_INPUT_LENGTH
-        )
-
-        # Move inputs to device
-        inputs = {k: v.to(model_state.device) for k, v in inputs.items()}
-
-        # Run inference (no gradient computation needed)
-        with torch.no_grad():
-            outputs = model_state.model(**inputs)
-            logits = outputs.logits
-
-            # Get prediction and confidence
-            probabilities = torch.softmax(logits, dim=-1)
-            confidence, predicted_class = torch.max(probabilities, dim=-1)
-
-            # Convert to Python types
-            predicted_class = predicted_class.item()
-            confidence = confidence.item()
-
-        # Map prediction to label
-        label = LABEL_MAP.get(predicted_class, "unknown")
+        # Serve repeated texts from the cache, otherwise queue the text for
+        # the batch worker and wait for its result
+        result = prediction_cache.get(request.text)
+        if result is None:
+            future = asyncio.get_running_loop().create_future()
+            await model_state.queue.put((request.text, future))
+            result = await future
+            prediction_cache.put(request.text, result)
 
         # Log result
-        logger.info(f"Prediction: {label} (confidence: {confidence:.4f})")
+        logger.info(f"Prediction: {result.label} (confidence: {result.confidence:.4f})")
 
-        return PredictionResponse(
-            label=label,
-            confidence=round(confidence, 4)
-        )
+        return result
 
     except Exception as e:
         logger.error(f"Prediction failed: {e}", exc_info=True)
@@ -310,5 +1080,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=False,  # Set to True for development
+        # Each worker loads its own model; WORKERS also splits the CPU cores
+        # between workers via OMP_NUM_THREADS/MKL_NUM_THREADS (see top of file)
+        workers=WORKERS,
         log_level="info"
     )
@@ -0,0 +1,282 @@
+"""
+Knowledge Distillation for NLP Manipulation Detector
+
+Distills the fine-tuned 6-layer DistilBERT classifier into a smaller
+3-layer student. The student is initialized from evenly spaced teacher layers
+and trained on the teacher's soft labels (KL divergence at temperature T),
+mixed with cross-entropy on the gold labels when the dataset provides them.
+
+Usage:
+    python distill_student.py --data ../data/headlines.csv
+
+The CSV needs a 'text' column and optionally a 'label' column (0/neutral or
+1/manipulative). Serve the student by pointing the API at it:
+    MODEL_PATH=../models/manipulation_detector_tiny uvicorn main:app
+"""
+
+import argparse
+import csv
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import torch
+import torch.nn.functional as F
+from transformers import (
+    AutoTokenizer,
+    DistilBertForSequenceClassification
+)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+TEACHER_PATH = Path("../models/manipulation_detector_model")
+STUDENT_PATH = Path("../models/manipulation_detector_tiny")
+STUDENT_LAYERS = 3
+MAX_INPUT_LENGTH = 128  # Headlines are short; keeps training fast
+
+# Label mapping (same as the API); CSV labels may be ids or names
+LABEL_MAP = {
+    0: "neutral",
+    1: "manipulative"
+}
+LABEL_IDS = {
+    **{str(label_id): label_id for label_id in LABEL_MAP},
+    **{name: label_id for label_id, name in LABEL_MAP.items()}
+}
+
+# Logging configuration
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# DATA LOADING
+# ============================================================================
+
+def load_dataset(path: Path) -> Tuple[List[str], Optional[List[int]]]:
+    """
+    Load texts (and gold labels, if present) from a CSV file.
+
+    Args:
+        path: CSV file with a 'text' column and an optional 'label' column
+
+    Returns:
+        Tuple of texts and labels (None when any label is missing, in which
+        case training uses the teacher's soft labels only)
+
+    Raises:
+        ValueError: If a label is neither a known id nor a known label name
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = [row for row in csv.DictReader(f) if (row.get("text") or "").strip()]
+
+    texts = [row["text"].strip() for row in rows]
+    labels = [(row.get("label") or "").strip() for row in rows]
+    if not rows or not all(labels):
+        if any(labels):
+            logger.warning("Some rows have no label; training on soft labels only")
+        return texts, None
+
+    unknown = sorted({label for label in labels if label.lower() not in LABEL_IDS})
+    if unknown:
+        raise ValueError(
+            f"Unknown label value(s) {', '.join(map(repr, unknown))}; "
+            f"expected one of {', '.join(LABEL_IDS)}"
+        )
+    return texts, [LABEL_IDS[label.lower()] for label in labels]
+
+
+# ============================================================================
+# STUDENT INITIALIZATION
+# ============================================================================
+
+def build_student(
+    teacher: DistilBertForSequenceClassification,
+    n_layers: int
+) -> DistilBertForSequenceClassification:
+    """
+    Create a shallower student initialized from the teacher's weights.
+
+    Embeddings and classification head are copied as-is; the transformer
+    layers are spread evenly over the teacher's, first and last included
+    (e.g. 0, 2, 5 for 3 of 6 layers, 0, 2, 3, 5 for 4 of 6).
+
+    Args:
+        teacher: Fine-tuned teacher classifier
+        n_layers: Number of transformer layers in the student
+
+    Returns:
+        Student classifier ready for training
+
+    Raises:
+        ValueError: If n_layers is not between 1 and the teacher's layer count
+    """
+    teacher_layers = teacher.config.n_layers
+    if not 1 <= n_layers <= teacher_layers:
+        raise ValueError(
+            f"Student must have between 1 and {teacher_layers} layers, got {n_layers}"
+        )
+
+    config = teacher.config.__class__.from_dict(teacher.config.to_dict())
+    config.n_layers = n_layers
+    student = DistilBertForSequenceClassification(config)
+
+    student.distilbert.embeddings.load_state_dict(
+        teacher.distilbert.embeddings.state_dict()
+    )
+
+    for i in range(n_layers):
+        source = round(i * (teacher_layers - 1) / max(n_layers - 1, 1))
+        student.distilbert.transformer.layer[i].load_state_dict(
+            teacher.distilbert.transformer.layer[source].state_dict()
+        )
+
+    student.pre_classifier.load_state_dict(teacher.pre_classifier.state_dict())
+    student.classifier.load_state_dict(teacher.classifier.state_dict())
+
+    return student
+
+
+# ============================================================================
+# TRAINING
+# ============================================================================
+
+def distillation_loss(
+    student_logits: torch.Tensor,
+    teacher_logits: torch.Tensor,
+    labels: Optional[torch.Tensor],
+    temperature: float,
+    alpha: float
+) -> torch.Tensor:
+    """
+    Combine soft-label KL divergence with gold-label cross-entropy.
+
+    Args:
+        student_logits: Student outputs for the batch
+        teacher_logits: Teacher outputs for the batch
+        labels: Gold labels, or None to train on soft labels only
+        temperature: Softmax temperature applied to both distributions
+        alpha: Weight of the KL term (1 - alpha weights the CE term)
+
+    Returns:
+        Scalar loss
+    """
+    kl = F.kl_div(
+        F.log_softmax(student_logits / temperature, dim=-1),
+        F.softmax(teacher_logits / temperature, dim=-1),
+        reduction="batchmean"
+    ) * temperature ** 2
+
+    if labels is None:
+        return kl
+    return alpha * kl + (1 - alpha) * F.cross_entropy(student_logits, labels)
+
+
+def main():
+    """Distill the teacher into a student and save it."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--data", type=Path, required=True, help="Training CSV")
+    parser.add_argument("--teacher", type=Path, default=TEACHER_PATH)
+    parser.add_argument("--output", type=Path, default=STUDENT_PATH)
+    parser.add_argument("--layers", type=int, default=STUDENT_LAYERS)
+    parser.add_argument("--epochs", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--lr", type=float, default=5e-5)
+    parser.add_argument("--temperature", type=float, default=2.0)
+    parser.add_argument("--alpha", type=float, default=0.5)
+    args = parser.parse_args()
+
+    try:
+        texts, labels = load_dataset(args.data)
+    except ValueError as e:
+        parser.error(f"Invalid labels in {args.data}: {e}")
+    if not texts:
+        parser.error(f"No rows with a non-empty 'text' column in {args.data}")
+    logger.info(
+        f"Loaded {len(texts)} examples from {args.data} "
+        f"({'with' if labels is not None else 'without'} gold labels)"
+    )
+
+    tokenizer = AutoTokenizer.from_pretrained("distilbert-base-uncased", use_fast=True)
+    teacher = DistilBertForSequenceClassification.from_pretrained(str(args.teacher))
+    teacher.eval()
+
+    student = build_student(teacher, args.layers)
+    logger.info(
+        f"Teacher parameters: {sum(p.numel() for p in teacher.parameters()):,}, "
+        f"student parameters: {sum(p.numel() for p in student.parameters()):,}"
+    )
+
+    optimizer = torch.optim.AdamW(student.parameters(), lr=args.lr)
+
+    for epoch in range(args.epochs):
+        student.train()
+        order = torch.randperm(len(texts)).tolist()
+        total_loss = 0.0
+
+        for start in range(0, len(order), args.batch_size):
+            idx = order[start:start + args.batch_size]
+            inputs = tokenizer(
+                [texts[i] for i in idx],
+                return_tensors="pt",
+                truncation=True,
+                padding="longest",
+                max_length=MAX_INPUT_LENGTH
+            )
+            batch_labels = (
+                torch.tensor([labels[i] for i in idx]) if labels is not None else None
+            )
+
+            # Soft labels from the teacher
+            with torch.no_grad():
+                teacher_logits = teacher(**inputs).logits
+
+            student_logits = student(**inputs).logits
+            loss = distillation_loss(
+                student_logits,
+                teacher_logits,
+                batch_labels,
+                args.temperature,
+                args.alpha
+            )
+
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+            total_loss += loss.item() * len(idx)
+
+        logger.info(f"Epoch {epoch + 1}/{args.epochs}: loss {total_loss / len(texts):.4f}")
+
+    # Report agreement with the teacher on the training texts
+    student.eval()
+    agree = 0
+    with torch.no_grad():
+        for start in range(0, len(texts), args.batch_size):
+            inputs = tokenizer(
+                texts[start:start + args.batch_size],
+                return_tensors="pt",
+                truncation=True,
+                padding="longest",
+                max_length=MAX_INPUT_LENGTH
+            )
+            agree += (
+                student(**inputs).logits.argmax(-1) == teacher(**inputs).logits.argmax(-1)
+            ).sum().item()
+    logger.info(f"Student/teacher label agreement: {agree / len(texts):.1%}")
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    student.save_pretrained(str(args.output))
+    logger.info(f"Student saved to {args.output}")
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    main()
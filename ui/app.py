@@ -13,6 +13,7 @@ from typing import Optional, Dict, Any
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, ConnectionError, Timeout
 
 # ============================================================================
@@ -27,6 +28,9 @@ HEALTH_ENDPOINT = f"{API_BASE_URL}/health"
 # Request timeout in seconds
 REQUEST_TIMEOUT = 10
 
+# How long a health check result is reused across reruns, in seconds
+HEALTH_CHECK_TTL = 5
+
 # UI configuration
 MAX_INPUT_LENGTH = 2000  # Character limit for input
 
@@ -37,20 +41,43 @@ EXAMPLE_TEXTS = {
     "🚨 Clickbait": "URGENT: You WON'T BELIEVE what happened next!",
     "📊 Factual": "Study shows moderate increase in unemployment rates"
 }
+EXAMPLE_ITEMS = list(EXAMPLE_TEXTS.items())
 
 # ============================================================================
 # API INTERACTION FUNCTIONS
 # ============================================================================
 
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Return a shared HTTP session with a pooled connection to the API.
+
+    Reusing the session keeps the TCP/TLS connection open across reruns
+    instead of reconnecting on every health check and prediction.
+
+    Returns:
+        requests.Session: Session shared by all reruns
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=HEALTH_CHECK_TTL, show_spinner=False)
 def check_api_health() -> bool:
     """
     Check if the API is running and healthy.
 
+    The result is cached for HEALTH_CHECK_TTL seconds so that reruns
+    triggered by typing or clicking do not each poll the API.
+
     Returns:
         bool: True if API is healthy, False otherwise
     """
     try:
-        response = requests.get(HEALTH_ENDPOINT, timeout=5)
+        response = get_http_session().get(HEALTH_ENDPOINT, timeout=5)
         if response.status_code == 200:
             data = response.json()
             return data.get("status") == "healthy"
@@ -74,7 +101,7 @@ def predict_manipulation(text: str) -> Optional[Dict[str, Any]]:
     """
     try:
         # Make POST request to API
-        response = requests.post(
+        response = get_http_session().post(
             PREDICT_ENDPOINT,
             json={"text": text},
             timeout=REQUEST_TIMEOUT
@@ -204,12 +231,6 @@ def main():
     if "text_input" not in st.session_state:
         st.session_state.text_input = ""
 
-    # Check if example button was clicked (before rendering text area)
-    for idx, (label, text) in enumerate(EXAMPLE_TEXTS.items()):
-        if st.session_state.get(f"example_clicked_{idx}", False):
-            st.session_state.text_input = text
-            st.session_state[f"example_clicked_{idx}"] = False
-
     # Text input area (using session state as default value)
     user_input = st.text_area(
         label="Input Text",
@@ -226,8 +247,8 @@ def main():
 
     # Example buttons (below text input)
     st.caption("Or try an example:")
-    cols = st.columns(4)
-    for idx, (label, text) in enumerate(EXAMPLE_TEXTS.items()):
+    cols = st.columns(len(EXAMPLE_ITEMS))
+    for idx, (label, text) in enumerate(EXAMPLE_ITEMS):
         with cols[idx]:
             if st.button(label, key=f"example_{idx}", use_container_width=True):
                 st.session_state.text_input = text